@@ -1,31 +1,242 @@
 import keyword
 import logging
-from copy import deepcopy
+import sys
+import threading
+from functools import lru_cache
 from pathlib import Path
 from pprint import pformat
-from typing import Any, Dict, List, Optional, Tuple, Type, Union
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Set, Tuple, Type, Union
 
-import toml as _toml
 import yaml as _yaml
-from camel_converter import to_snake as _to_snake
-from munch import munchify as _munchify
+from munch import Munch as _Munch
 from pydantic import BaseModel, ConfigDict, Field, create_model, model_validator
-from toml import decoder as _toml_decoder
 
 
-logging.basicConfig(format='%(asctime)-15s \t%(levelname)-8s \t%(name)-8s \t%(message)s')
+if sys.version_info >= (3, 11):
+    import tomllib as _tomllib
+else:
+    import tomli as _tomllib
+
+
+# use LibYAML bindings when available, they are much faster than pure Python parser
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader as _YamlLoader  # type: ignore
+
+
 logger = logging.getLogger(__name__)
 
 
 ConfigType = Dict[str, Any]
 
 
+_KEYWORDS = frozenset(keyword.kwlist)
+
+
+# same section names (e.g. `name`, `host`) repeat within and across configs
+@lru_cache(maxsize=4096)
+def _to_snake(section: str) -> str:
+    # imported lazily, most callers never convert keys to snake case
+    from camel_converter import to_snake
+
+    return to_snake(section)
+
+
 PyyaConfig = Any
 
 
 class PyyaError(RuntimeError): ...
 
 
+def _configure_logging() -> None:
+    logging.basicConfig(format='%(asctime)-15s \t%(levelname)-8s \t%(name)-8s \t%(message)s')
+
+
+def _sanitize_keys(data: ConfigType, sanitize: Callable[[Any], Any]) -> ConfigType:
+    return {
+        sanitize(key): _sanitize_keys(entry, sanitize) if isinstance(entry, dict) else entry
+        for key, entry in data.items()
+    }
+
+
+def _load_yaml(buf: bytes, sanitize: Optional[Callable[[Any], Any]]) -> Any:
+    data = _yaml.load(buf, Loader=_YamlLoader)
+    # keys are sanitized after loading: anchored mappings may be shared between list items and sections
+    if sanitize is None or not isinstance(data, dict):
+        return data
+    return _sanitize_keys(data, sanitize)
+
+
+def _load_toml(buf: bytes, sanitize: Optional[Callable[[Any], Any]]) -> Any:
+    data = _tomllib.loads(buf.decode('utf-8'))
+    if sanitize is None:
+        return data
+    return _sanitize_keys(data, sanitize)
+
+
+def _munchify(obj: Any) -> Any:
+    # unlike `munch.munchify` needs no cycle tracking: parsed configs contain only dicts, lists and scalars
+    obj_type = type(obj)
+    if obj_type is dict:
+        return _Munch((k, _munchify(v)) for k, v in obj.items())
+    if obj_type is list:
+        return [_munchify(v) for v in obj]
+    return obj
+
+
+# https://stackoverflow.com/questions/73958753/return-all-extra-passed-to-pydantic-model
+class _ExtraBase(BaseModel):
+    model_config = ConfigDict(strict=True)
+    extra: Dict[str, Any] = Field(default={}, exclude=True)
+
+    @model_validator(mode='before')
+    @classmethod
+    def validator(cls, values: Any) -> Any:
+        if cls.model_config.get('extra') == 'allow':
+            extra, valid = {}, {}
+            for key, value in values.items():
+                if not isinstance(key, str):
+                    continue
+                if key in cls.model_fields:
+                    valid[key] = value
+                else:
+                    extra[key] = value
+            valid['extra'] = extra
+            return valid
+        return values
+
+    @property
+    def extra_flat(self) -> Dict[Tuple[str, ...], Any]:
+        # keys are paths to extra sections, e.g. `('database', 'garbage')`
+        extra_flat: Dict[Tuple[str, ...], Any] = {}
+        stack: List[Tuple[Tuple[str, ...], _ExtraBase]] = [((), self)]
+        while stack:
+            path, model = stack.pop()
+            for k, v in model.extra.items():
+                extra_flat[(*path, k)] = v
+            for name, value in model:
+                if isinstance(value, _ExtraBase):
+                    stack.append(((*path, name), value))
+        return extra_flat
+
+
+class _ExtraAllowBase(_ExtraBase):
+    model_config = ConfigDict(extra='allow')
+
+
+class _ExtraForbidBase(_ExtraBase):
+    model_config = ConfigDict(extra='forbid')
+
+
+# guards writes to module-level caches, lookups with `dict.get` are atomic and need no lock
+_CACHE_LOCK = threading.Lock()
+
+
+def _cache_put(cache: Dict[Any, Any], key: Any, value: Any, size: int) -> Any:
+    # module-level caches live as long as the process, oldest entries are evicted first
+    with _CACHE_LOCK:
+        if len(cache) >= size:
+            del cache[next(iter(cache))]
+        cache[key] = value
+    return value
+
+
+_LIST_TYPES: Dict[Any, Any] = {}  # share `List[T]` generics between fields with the same item type
+_LIST_TYPES_SIZE = 64
+
+
+def _field_type(section: str, entry: Any, base: Type[_ExtraBase]) -> Tuple[Any, Any]:
+    """Return the annotation for `entry` together with a hashable key describing its shape."""
+    entry_type = type(entry)
+    if entry_type is dict:
+        return _model_from_dict(section, entry, base)
+    if entry_type is not list:
+        return entry_type, entry_type
+    if not entry:
+        return List[Any], (list, Any)
+    item_type = type(entry[0])
+    if item_type is dict:
+        item_model, item_shape = _model_from_dict(f'{section.capitalize()}_item', entry[0], base)
+        return List[item_model], (list, item_shape)  # type: ignore
+    if (list_type := _LIST_TYPES.get(item_type)) is None:
+        list_type = _cache_put(_LIST_TYPES, item_type, List[item_type], _LIST_TYPES_SIZE)  # type: ignore
+    return list_type, (list, item_type)
+
+
+def _model_fields(data: Dict[Any, Any], base: Type[_ExtraBase]) -> Tuple[Dict[Any, Any], Tuple[Any, ...]]:
+    fields: Dict[Any, Any] = {}
+    shape = []
+    for section, entry in data.items():
+        if isinstance(section, str):
+            field_type, field_shape = _field_type(section, entry, base)
+            fields[section] = (field_type, entry)
+            shape.append((section, field_shape))
+    return fields, tuple(shape)
+
+
+# nested models keyed by base and shape, so identically shaped subtrees share one class
+_SUBMODEL_CACHE: Dict[Tuple[Any, ...], Type[_ExtraBase]] = {}
+_SUBMODEL_CACHE_SIZE = 256
+
+
+def _model_from_dict(name: str, data: Dict[Any, Any], base: Type[_ExtraBase]) -> Tuple[Type[_ExtraBase], Any]:
+    fields, shape = _model_fields(data, base)
+    key = (base, shape)
+    if (model := _SUBMODEL_CACHE.get(key)) is None:
+        model = _cache_put(_SUBMODEL_CACHE, key, create_model(name, **fields, __base__=base), _SUBMODEL_CACHE_SIZE)
+    return model, shape
+
+
+# compiled validators of root models keyed by base and shape of default config,
+# calling them directly skips the `model_validate` wrapper
+_VALIDATOR_CACHE: Dict[Tuple[Any, ...], Callable[[Any], _ExtraBase]] = {}
+_VALIDATOR_CACHE_SIZE = 32
+
+
+_LOADERS: Dict[str, Callable[[bytes, Optional[Callable[[Any], Any]]], Any]] = {
+    '.yaml': _load_yaml,
+    '.yml': _load_yaml,
+    '.toml': _load_toml,
+}
+
+
+# parsed files keyed by path, inode, mtime, ctime, size and sanitize flags, oldest entries are evicted first
+_PARSE_CACHE: Dict[Tuple[Any, ...], Any] = {}
+_PARSE_CACHE_SIZE = 32
+
+
+def _copy_tree(obj: Any) -> Any:
+    # cached trees are shared, so every mutable container is copied (YAML `!!set` gives sets,
+    # `!!omap` and `!!pairs` give lists of tuples that may hold mappings), other values are immutable
+    obj_type = type(obj)
+    if obj_type is dict:
+        return {k: _copy_tree(v) for k, v in obj.items()}
+    if obj_type is list:
+        return [_copy_tree(v) for v in obj]
+    if obj_type is tuple:
+        return tuple(_copy_tree(v) for v in obj)
+    if obj_type is set:
+        return set(obj)
+    return obj
+
+
+def _parse_file(
+    file_path: Path,
+    file_handler: Callable[[bytes, Optional[Callable[[Any], Any]]], Any],
+    sanitize: Optional[Callable[[Any], Any]],
+    sanitize_flags: Tuple[bool, ...],
+) -> Any:
+    stat = file_path.stat()
+    # ctime can't be set from userland, so mtime-preserving copies (`cp -p`, `rsync -t`) still change the key
+    key = (str(file_path.absolute()), stat.st_ino, stat.st_mtime_ns, stat.st_ctime_ns, stat.st_size, sanitize_flags)
+    try:
+        data = _PARSE_CACHE[key]
+    except KeyError:  # not cached yet or already evicted by another thread
+        data = _cache_put(_PARSE_CACHE, key, file_handler(file_path.read_bytes(), sanitize), _PARSE_CACHE_SIZE)
+    return _copy_tree(data)
+
+
 def init_config(
     config: Union[str, Path] = 'config.yaml',
     default_config: Union[str, Path] = 'default.config.yaml',
@@ -57,36 +268,62 @@ def init_config(
         allow_extra_sections: raise error on any extra sections in production config
         warn_extra_sections: if extra sections are allowed, warn about extra keys and values
     """
+    # paths are built once and reused for reading, caching and stub generation
+    config_path = config if isinstance(config, Path) else Path(config)
+    default_config_path = default_config if isinstance(default_config, Path) else Path(default_config)
 
     def _merge_configs(
-        _raw_data: ConfigType, _default_raw_data: ConfigType, sections: Optional[List[str]] = None
+        _raw_data: ConfigType, _default_raw_data: ConfigType, overwritten: Optional[ConfigType] = None
     ) -> None:
-        if sections is None:
-            sections = []  # for logging
-        for section, entry in _default_raw_data.items():
-            sections.append(section)
-            if sections_ignored_on_merge:
-                if section in sections_ignored_on_merge:
-                    logger.debug(f'section `{section}` ignored on merge')
+        # walk nested sections with explicit stack instead of recursion,
+        # dotted prefix of each section (e.g. `logging.rotate.`) is kept for logging
+        stack: List[Tuple[ConfigType, ConfigType, str]] = [(_raw_data, _default_raw_data, '')]
+        debug = logger.isEnabledFor(logging.DEBUG)
+        # section names are needed only for logging
+        track_paths = debug or overwritten is not None
+        leaf_fast_path = not ignored_sections and not debug
+        # bind hot-loop methods to locals to skip repeated attribute lookups
+        push, pop, log_debug = stack.append, stack.pop, logger.debug
+        while stack:
+            raw_data, default_raw_data, prefix = pop()
+            if leaf_fast_path and not any(type(entry) is dict for entry in default_raw_data.values()):
+                # nothing to descend into, so take missing values from default in bulk
+                if overwritten is not None:
+                    overwritten.update(
+                        (f'{prefix}{section}', raw_data[section])
+                        for section in default_raw_data
+                        if raw_data.get(section) is not None
+                    )
+                raw_data.update({k: v for k, v in default_raw_data.items() if raw_data.get(k) is None})
+                continue
+            for section, entry in default_raw_data.items():
+                if ignored_sections and section in ignored_sections:
+                    log_debug('section `%s%s` ignored on merge', prefix, section)
                     continue
-                elif isinstance(entry, Dict):
-                    # is it fine to proccess already poped dicts on recursion?
-                    entry = _pop_ignored_keys(entry)
-            if section not in _raw_data or _raw_data[section] is None:
-                _raw_data[section] = entry
-                logger.debug(f'section `{".".join(sections)}` with value `{entry}` taken from {default_config}')
-            elif isinstance(entry, Dict):
-                _merge_configs(_raw_data[section], entry, sections)
-            # TODO: add support for merging lists
-            else:
-                logger.debug(f'section `{".".join(sections)}` already exists in {config}, skipping')
-            sections.pop()
+                # missing and null sections are both taken from default, so one lookup covers both
+                existing = raw_data.get(section)
+                if existing is None:
+                    raw_data[section] = entry
+                    log_debug('section `%s%s` with value `%s` taken from %s', prefix, section, entry, default_config)
+                elif isinstance(entry, dict):
+                    if type(existing) is not dict:
+                        err_msg = f'section `{prefix}{section}` in {config} must be a mapping as in {default_config}'
+                        logger.error(err_msg)
+                        raise PyyaError(err_msg)
+                    push((existing, entry, f'{prefix}{section}.' if track_paths else ''))
+                # TODO: add support for merging lists
+                else:
+                    if overwritten is not None:
+                        overwritten[f'{prefix}{section}'] = existing
+                    log_debug('section `%s%s` already exists in %s, skipping', prefix, section, config)
 
+    # flags are fixed for the whole call, so the same section is always sanitized the same way
+    @lru_cache(maxsize=None, typed=True)
     def _sanitize_section(section: Any) -> Any:
         if not isinstance(section, str):
             return section
         if convert_keys_to_snake_case:
-            logger.debug(f'converting section `{section}` to snake case')
+            logger.debug('converting section `%s` to snake case', section)
             section = _to_snake(section)
         if raise_error_non_identifiers and not section.isidentifier():
             err_msg = f'section `{section}` is not a valid identifier, aborting'
@@ -94,137 +331,105 @@ def init_config(
             raise PyyaError(err_msg)
         if replace_dashes_with_underscores:
             section = section.replace('-', '_')
-        if add_underscore_prefix_to_keywords and keyword.iskeyword(section):
-            logger.debug(f'section `{section}` is a keyword, renaming to `_{section}`')
+        if add_underscore_prefix_to_keywords and section in _KEYWORDS:
+            logger.debug('section `%s` is a keyword, renaming to `_%s`', section, section)
             section = f'_{section}'
         return section
 
-    def _pop_ignored_keys(data: ConfigType) -> ConfigType:
-        for key, entry in data.copy().items():
-            if sections_ignored_on_merge and key in sections_ignored_on_merge:
-                data.pop(key)
-                logger.debug(f'section `{key}` ignored on merge')
-            elif isinstance(entry, Dict):
-                _pop_ignored_keys(entry)
-        return data
+    # loaders skip sanitizing entirely when no flag changes section names
+    sanitize_keys = (
+        _sanitize_section
+        if convert_keys_to_snake_case
+        or add_underscore_prefix_to_keywords
+        or raise_error_non_identifiers
+        or replace_dashes_with_underscores
+        else None
+    )
+    sanitize_flags = (
+        convert_keys_to_snake_case,
+        add_underscore_prefix_to_keywords,
+        raise_error_non_identifiers,
+        replace_dashes_with_underscores,
+    )
 
-    def _sanitize_keys(data: ConfigType) -> ConfigType:
-        for key in data.copy():
-            entry = data.pop(key, None)
-            key = _sanitize_section(key)
-            if isinstance(entry, Dict):
-                data[key] = _sanitize_keys(entry)
-            else:
-                data[key] = entry
+    def _pop_ignored_keys(data: ConfigType) -> ConfigType:
+        if not ignored_sections:
+            return data
+        for key in list(data):
+            if key in ignored_sections:
+                del data[key]
+                logger.debug('section `%s` ignored on merge', key)
+            elif isinstance(data[key], dict):
+                _pop_ignored_keys(data[key])
         return data
 
-    def _pop_nested(d: Dict[str, Any], dotted_key: str, default: Any = None) -> Any:
-        keys = dotted_key.split('.')
+    def _pop_nested(d: Dict[str, Any], keys: Tuple[str, ...], default: Any = None) -> Any:
         current = d
 
         for k in keys[:-1]:
-            if not isinstance(current, Dict) or k not in current:
+            if not isinstance(current, dict) or k not in current:
                 return default
             current = current[k]
 
         return current.pop(keys[-1], default)
 
-    # https://stackoverflow.com/questions/73958753/return-all-extra-passed-to-pydantic-model
-    class ExtraBase(BaseModel):
-        model_config = ConfigDict(strict=True, extra='allow' if allow_extra_sections else 'forbid')
-        extra: Dict[str, Any] = Field(default={}, exclude=True)
-
-        @model_validator(mode='before')
-        @classmethod
-        def validator(cls, values: Any) -> Any:
-            if cls.model_config.get('extra') == 'allow':
-                extra, valid = {}, {}
-                for key, value in values.items():
-                    if not isinstance(key, str):
-                        continue
-                    if key in cls.model_fields:
-                        valid[key] = value
-                    else:
-                        extra[key] = value
-                valid['extra'] = extra
-                return valid
-            return values
-
-        @property
-        def extra_flat(self) -> Any:
-            extra_flat = {**self.extra}
-            for name, value in self:
-                if isinstance(value, ExtraBase):
-                    data = {f'{name}.{k}': v for k, v in value.extra_flat.items()}
-                    extra_flat.update(data)
-            return extra_flat
-
     def is_identifier(data: str) -> bool:
-        return not keyword.iskeyword(data) and data.isidentifier()
-
-    def _model_and_stub_from_dict(
-        name: str, data: Dict[Any, Any], path: Optional[List[str]] = None
-    ) -> Tuple[Type[ExtraBase], str]:
-        fields: Dict[Any, Any] = {}
-        if path is None:
-            path = []
-        class_name = ''.join(part.capitalize() if i > 0 else part for i, part in enumerate(path + [name])).replace(
-            '-', '_'
-        )
+        return data not in _KEYWORDS and data.isidentifier()
+
+    def _capitalize(part: str) -> str:
+        # unlike `str.capitalize` keeps the rest of the name as is (e.g. `ttlSeconds` -> `TtlSeconds`)
+        return part[:1].upper() + part[1:]
+
+    def _stub_class_name(name: str, used_names: Set[str]) -> str:
+        # path parts are joined without separator, so different paths may produce the same name
+        name = name.replace('-', '_')
+        class_name, suffix = name, 2
+        while class_name in used_names:
+            class_name = f'{name}{suffix}'
+            suffix += 1
+        used_names.add(class_name)
+        return class_name
+
+    def _stub_from_dict(class_name: str, data: Dict[Any, Any], out: List[str], used_names: Set[str]) -> None:
+        # nested classes are appended to `out` before their parent
         stub_lines = [f'class {class_name}(dict[str, Any]):']
-        nested_stubs = []
-        py_type: Any
         for section, entry in data.items():
-            if not isinstance(section, str):
+            if not isinstance(section, str) or not is_identifier(section):
                 continue
-            if isinstance(entry, Dict):
-                nested_model, nested_stub = _model_and_stub_from_dict(section, entry, path + [name])
-                if is_identifier(section):
-                    stub_lines.append(f'    {section}: {class_name + section.capitalize()}')
-                    nested_stubs.append(nested_stub)
-                fields[section] = (nested_model, entry)
+            if isinstance(entry, dict):
+                nested_name = _stub_class_name(class_name + _capitalize(section), used_names)
+                stub_lines.append(f'    {section}: {nested_name}')
+                _stub_from_dict(nested_name, entry, out, used_names)
             elif isinstance(entry, list) and entry:
                 first_item = entry[0]
-                if isinstance(first_item, Dict):
-                    nested_model, nested_stub = _model_and_stub_from_dict(
-                        f'{section.capitalize()}_item', first_item, path + [name]
-                    )
-                    if is_identifier(section):
-                        stub_lines.append(f'    {section}: list[{class_name + section.capitalize()}_item]')
-                        nested_stubs.append(nested_stub)
-                    fields[section] = (List[nested_model], entry)  # type: ignore
+                if isinstance(first_item, dict):
+                    nested_name = _stub_class_name(f'{class_name}{_capitalize(section)}_item', used_names)
+                    stub_lines.append(f'    {section}: list[{nested_name}]')
+                    _stub_from_dict(nested_name, first_item, out, used_names)
                 else:
-                    py_type = type(first_item)
-                    if is_identifier(section):
-                        stub_lines.append(f'    {section}: list[{py_type.__name__}]')
-                    fields[section] = (List[py_type], entry)
+                    stub_lines.append(f'    {section}: list[{type(first_item).__name__}]')
             elif isinstance(entry, list):
-                if is_identifier(section):
-                    stub_lines.append(f'    {section}: list[Any]')
-                fields[section] = (List[Any], entry)
+                stub_lines.append(f'    {section}: list[Any]')
             else:
-                py_type = type(entry)
-                if is_identifier(section):
-                    stub_lines.append(f'    {section}: {py_type.__name__}')
-                fields[section] = (py_type, entry)
+                stub_lines.append(f'    {section}: {type(entry).__name__}')
         if len(stub_lines) == 1:
             stub_lines = [f'class {class_name}(dict[Any, Any]): ...']
-        stub_code = '\n\n'.join(nested_stubs + ['\n'.join(stub_lines)])
-        return create_model(name, **fields, __base__=ExtraBase), stub_code
+        out.append('\n'.join(stub_lines))
 
     def _get_default_raw_data() -> ConfigType:
         try:
             try:
-                file_path = Path(default_config)
-                if (ext := file_path.suffix) not in ('.yaml', '.yml', '.toml'):
+                if (file_handler := _LOADERS.get(default_config_path.suffix)) is None:
                     raise PyyaError(f'{default_config} file format is not supported') from None
-                file_handler = _yaml.safe_load if ext in ('.yaml', '.yml') else _toml.load
-                with open(Path(default_config)) as fstream:
-                    _default_raw_data: Optional[ConfigType] = file_handler(fstream)
-            except (_yaml.YAMLError, _toml_decoder.TomlDecodeError) as e:
+                _default_raw_data: Optional[ConfigType] = _parse_file(
+                    default_config_path, file_handler, sanitize_keys, sanitize_flags
+                )
+            except (_yaml.YAMLError, _tomllib.TOMLDecodeError) as e:
                 raise PyyaError(f'{default_config} file is corrupted: {e}') from None
             if _default_raw_data is None:
                 raise FileNotFoundError()
+            if not isinstance(_default_raw_data, dict):
+                raise PyyaError(f'{default_config} file must contain a mapping')
         except FileNotFoundError as e:
             logger.error(e)
             raise PyyaError(f'{default_config} file is missing or empty') from None
@@ -235,17 +440,18 @@ def init_config(
             err_msg = f'{default_config} Unknown error: {e}'
             logger.error(err_msg)
             raise PyyaError(err_msg) from None
-        _default_raw_data = _sanitize_keys(_default_raw_data)
         return _default_raw_data
 
     if _generate_stub:
-        output_file = Path(config)
+        output_file = config_path
         if output_file.exists():
             err_msg = f'{output_file} already exists'
             logger.error(err_msg)
             raise PyyaError(err_msg)
         _default_raw_data = _get_default_raw_data()
-        _, stub = _model_and_stub_from_dict('Config', _default_raw_data)
+        stubs: List[str] = []
+        _stub_from_dict('Config', _default_raw_data, stubs, {'Config'})
+        stub = '\n\n'.join(stubs)
         stub_full = (
             f'# {output_file} was autogenerated from {default_config} with pyya CLI tool, see `pyya -h`\n'
             f'from __future__ import annotations\n\n'
@@ -256,21 +462,19 @@ def init_config(
             f'{_stub_variable_name}: Config\n'
         )
         output_file.write_text(stub_full)
-        logger.info(f'{output_file} created')
+        logger.info('%s created', output_file)
         return None
 
     try:
-        file_path = Path(config)
-        if (ext := file_path.suffix) not in ('.yaml', '.yml', '.toml'):
+        if (file_handler := _LOADERS.get(config_path.suffix)) is None:
             raise PyyaError(f'{config} file format is not supported') from None
-        file_handler = _yaml.safe_load if ext in ('.yaml', '.yml') else _toml.load
-        with open(Path(config)) as fstream:
-            _raw_data: ConfigType = file_handler(fstream) or {}
-            _raw_data = _sanitize_keys(_raw_data)
-    except (_yaml.YAMLError, _toml_decoder.TomlDecodeError) as e:
+        _raw_data: ConfigType = _parse_file(config_path, file_handler, sanitize_keys, sanitize_flags) or {}
+        if not isinstance(_raw_data, dict):
+            raise PyyaError(f'{config} file must contain a mapping')
+    except (_yaml.YAMLError, _tomllib.TOMLDecodeError) as e:
         raise PyyaError(f'{config} file is corrupted: {e}') from None
     except FileNotFoundError:
-        logger.warning(f'{config} file not found, using {default_config}')
+        logger.warning('%s file not found, using %s', config, default_config)
         _raw_data = {}
     except PyyaError as e:
         logger.error(e)
@@ -281,38 +485,56 @@ def init_config(
         raise PyyaError(err_msg) from None
 
     if merge_configs:
-        if sections_ignored_on_merge is None:
-            sections_ignored_on_merge = []
         try:
-            sections_ignored_on_merge = [_sanitize_section(s) for s in sections_ignored_on_merge]
+            ignored_sections: FrozenSet[Any] = frozenset(_sanitize_section(s) for s in sections_ignored_on_merge or ())
         except Exception as e:
             err_msg = f'Failed parsing `sections_ignored_on_merge`: {e!r}'
             logger.error(err_msg)
             raise PyyaError(err_msg) from None
         _default_raw_data = _get_default_raw_data()
-        # create copy for logging (only overwritten fields)
-        _raw_data_copy = deepcopy(_raw_data)
-        _merge_configs(_raw_data, _default_raw_data)
-        logger.debug(f'Resulting config after merge:\n{pformat(_raw_data)}')
+        if ignored_sections:
+            # nested ignored sections are dropped from default in one pass, top-level ones are skipped on merge
+            for section, entry in _default_raw_data.items():
+                if isinstance(entry, dict) and section not in ignored_sections:
+                    _pop_ignored_keys(entry)
+        # collected during merge for logging (only overwritten fields)
+        overwritten: Optional[ConfigType] = {} if logger.isEnabledFor(logging.INFO) else None
+        _merge_configs(_raw_data, _default_raw_data, overwritten)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('Resulting config after merge:\n%s', pformat(_raw_data))
         if validate_data_types:
-            ConfigModel, _ = _model_and_stub_from_dict('ConfigModel', _default_raw_data)
+            extra_sections: Dict[Tuple[str, ...], Any]
             try:
-                validated_raw_data = ConfigModel.model_validate(_raw_data)
-                if extra_sections := validated_raw_data.extra_flat:  # type: ignore
+                base = _ExtraAllowBase if allow_extra_sections else _ExtraForbidBase
+                fields, shape = _model_fields(_default_raw_data, base)
+                if (validate := _VALIDATOR_CACHE.get((base, shape))) is None:
+                    ConfigModel = create_model('ConfigModel', **fields, __base__=base)
+                    validate = _cache_put(
+                        _VALIDATOR_CACHE,
+                        (base, shape),
+                        ConfigModel.__pydantic_validator__.validate_python,
+                        _VALIDATOR_CACHE_SIZE,
+                    )
+                extra_sections = validate(_raw_data).extra_flat
+                if extra_sections:
                     if warn_extra_sections:
-                        logger.warning(f'The following extra sections will be ignored:\n{pformat(extra_sections)}')
+                        logger.warning(
+                            'The following extra sections will be ignored:\n%s',
+                            pformat({'.'.join(k): v for k, v in extra_sections.items()}),
+                        )
                     # remove extra sections from resulting config
                     for k in extra_sections:
-                        _pop_nested(_raw_data_copy, k)
                         _pop_nested(_raw_data, k)
             except Exception as e:
                 err_msg = f'Failed validating config file: {e!r}'
                 logger.error(err_msg)
                 raise PyyaError(err_msg) from None
-        if _raw_data_copy:
-            logger.info(f'The following sections were overwritten:\n{pformat(_raw_data_copy)}')
+        if overwritten:
+            logger.info('The following sections were overwritten:\n%s', pformat(overwritten))
+    if logger.isEnabledFor(logging.DEBUG):
+        # format plain dict before it is munchified
+        logger.debug('Resulting config:\n%s', pformat(_raw_data))
     try:
-        logger.debug(f'Resulting config:\n{pformat(_raw_data)}')
         return _munchify(_raw_data)
     except Exception as e:
         err_msg = f'Failed parsing config file: {e!r}'
@@ -2,7 +2,7 @@ import argparse
 import logging
 import sys
 
-from pyya import PyyaError, init_config, logger
+from pyya import PyyaError, _configure_logging, init_config, logger
 
 
 def main() -> None:
@@ -17,6 +17,7 @@ def main() -> None:
     parser.add_argument('--replace-dashes', action='store_true', help='replace dashes with underscores in names')
     parser.add_argument('--debug', action='store_true', help='print debug messages')
     args = parser.parse_args()
+    _configure_logging()
     logger.setLevel(logging.INFO)
     if args.debug:
         logger.setLevel(logging.DEBUG)
@@ -1,3 +1,6 @@
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
@@ -76,6 +79,122 @@ def test_raise_err_extra_sections_access() -> None:
         _ = config.database.garbage
 
 
+def test_raise_err_extra_sections_after_allowed() -> None:
+    _ = pyya.init_config(config=config_extra, default_config=default_config_extra)
+    with pytest.raises(pyya.PyyaError, match=r'Extra inputs are not permitted'):
+        _ = pyya.init_config(
+            config=config_extra,
+            default_config=default_config_extra,
+            allow_extra_sections=False,
+        )
+
+
+def test_model_caches_are_bounded(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(pyya, '_VALIDATOR_CACHE_SIZE', 1)
+    monkeypatch.setattr(pyya, '_SUBMODEL_CACHE_SIZE', 1)
+    monkeypatch.setattr(pyya, '_VALIDATOR_CACHE', {})
+    monkeypatch.setattr(pyya, '_SUBMODEL_CACHE', {})
+    config = tmp_path / 'config.yaml'
+    config.write_text('{}\n')
+    default_config = tmp_path / 'default.config.yaml'
+    for i in range(3):
+        default_config.write_text(f'app:\n  port{i}: 80\n')
+        _ = pyya.init_config(config=config, default_config=default_config)
+    assert len(pyya._VALIDATOR_CACHE) <= 1
+    assert len(pyya._SUBMODEL_CACHE) <= 1
+
+
+def test_reparse_config_with_preserved_mtime(tmp_path: Path) -> None:
+    config = tmp_path / 'config.yaml'
+    default_config = tmp_path / 'default.config.yaml'
+    default_config.write_text('port: 80\n')
+    config.write_text('port: 8080\n')
+    stat = config.stat()
+    assert pyya.init_config(config=config, default_config=default_config).port == 8080
+    config.write_text('port: 9090\n')
+    os.utime(config, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert pyya.init_config(config=config, default_config=default_config).port == 9090
+
+
+def test_cached_config_mutable_values_not_shared(tmp_path: Path) -> None:
+    config = tmp_path / 'config.yaml'
+    config.write_text('tags: !!set {a: null}\n')
+    default_config = tmp_path / 'default.config.yaml'
+    default_config.write_text('tags: !!set {b: null}\n')
+    first = pyya.init_config(config=config, default_config=default_config, validate_data_types=False)
+    first.tags.add('c')
+    second = pyya.init_config(config=config, default_config=default_config, validate_data_types=False)
+    assert second.tags == {'a'}
+
+
+def test_init_config_concurrent_calls(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(pyya, '_PARSE_CACHE_SIZE', 1)
+    monkeypatch.setattr(pyya, '_VALIDATOR_CACHE_SIZE', 1)
+    monkeypatch.setattr(pyya, '_SUBMODEL_CACHE_SIZE', 1)
+    config = tmp_path / 'config.yaml'
+    config.write_text('{}\n')
+    defaults = []
+    for i in range(4):
+        default_config = tmp_path / f'default{i}.yaml'
+        default_config.write_text(f'app{i}:\n  port: 80\n')
+        defaults.append(default_config)
+
+    def load(default_config: Path) -> None:
+        for _ in range(20):
+            _ = pyya.init_config(config=config, default_config=default_config)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        for future in [executor.submit(load, default_config) for default_config in defaults * 2]:
+            future.result()
+
+
+def test_raise_err_section_not_mapping(tmp_path: Path) -> None:
+    config = tmp_path / 'config.yaml'
+    config.write_text('a: x\n')
+    default_config = tmp_path / 'default.config.yaml'
+    default_config.write_text('a:\n  b: 1\n')
+    with pytest.raises(pyya.PyyaError, match=r'section `a` in .*config.yaml must be a mapping'):
+        _ = pyya.init_config(config=config, default_config=default_config)
+    config.write_text('a: [1]\n')
+    with pytest.raises(pyya.PyyaError, match=r'section `a` in .*config.yaml must be a mapping'):
+        _ = pyya.init_config(config=config, default_config=default_config)
+
+
+def test_raise_err_config_not_mapping(tmp_path: Path) -> None:
+    config = tmp_path / 'config.yaml'
+    config.write_text('- a\n- b\n')
+    with pytest.raises(pyya.PyyaError, match=r'config.yaml file must contain a mapping'):
+        _ = pyya.init_config(config=config, default_config=default_config_path)
+
+
+def test_raise_err_default_not_mapping(tmp_path: Path) -> None:
+    default_config = tmp_path / 'default.yaml'
+    default_config.write_text('- a\n- b\n')
+    with pytest.raises(pyya.PyyaError, match=r'default.yaml file must contain a mapping'):
+        _ = pyya.init_config(config=config_path, default_config=default_config)
+
+
+def test_reparse_modified_config(tmp_path: Path) -> None:
+    config = tmp_path / 'config.yaml'
+    default_config = tmp_path / 'default.config.yaml'
+    config.write_text('app:\n  port: 8080\n')
+    default_config.write_text('app:\n  port: 80\n  debug: false\n')
+    first = pyya.init_config(config=config, default_config=default_config)
+    first.app.port = 1
+    assert pyya.init_config(config=config, default_config=default_config).app.port == 8080
+    config.write_text('app:\n  port: 9090\n  debug: true\n')
+    second = pyya.init_config(config=config, default_config=default_config)
+    assert second.app.port == 9090
+    assert second.app.debug is True
+
+
+def test_log_overwritten_sections(caplog: pytest.LogCaptureFixture) -> None:
+    caplog.set_level(logging.INFO, logger='pyya')
+    _ = pyya.init_config(config=config_path, default_config=default_config_path, validate_data_types=False)
+    assert "'database.user': 'myuser_changed'" in caplog.text
+    assert "'database.host'" not in caplog.text
+
+
 def test_generate_stub() -> None:
     assert not config_stub.exists()
     _ = pyya.init_config(
@@ -87,6 +206,18 @@ def test_generate_stub() -> None:
     config_stub.unlink()
 
 
+def test_generate_stub_unique_class_names(tmp_path: Path) -> None:
+    default_config = tmp_path / 'default.config.yaml'
+    default_config.write_text('db:\n  pool:\n    size: 1\ndbPool:\n  name: x\n')
+    stub_path = tmp_path / 'config.pyi'
+    _ = pyya.init_config(config=stub_path, default_config=default_config, _generate_stub=True)
+    stub = stub_path.read_text()
+    assert 'class ConfigDb(dict[str, Any]):\n    pool: ConfigDbPool\n' in stub
+    assert 'class ConfigDbPool(dict[str, Any]):\n    size: int\n' in stub
+    assert 'class ConfigDbPool2(dict[str, Any]):\n    name: str\n' in stub
+    assert '    dbPool: ConfigDbPool2\n' in stub
+
+
 def test_generate_stub_exist() -> None:
     _ = pyya.init_config(
         config=config_stub,
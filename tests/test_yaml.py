@@ -79,3 +79,13 @@ def test_sections_ignored_on_merge() -> None:
 def test_validate_data_types() -> None:
     with pytest.raises(pyya.PyyaError, match=r'logging.rotate.enabled'):
         _ = pyya.init_config(config=config_path, default_config=default_config_path)
+
+
+def test_convert_snake_case_anchor_in_list(tmp_path: Path) -> None:
+    config = tmp_path / 'config.yaml'
+    config.write_text('items:\n  - &b {hostName: x}\nbase: *b\n')
+    default_config = tmp_path / 'default.config.yaml'
+    default_config.write_text('items: []\nbase:\n  host_name: y\n')
+    result = pyya.init_config(config=config, default_config=default_config, convert_keys_to_snake_case=True)
+    assert result.base.host_name == 'x'
+    assert 'hostName' not in result.base